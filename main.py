@@ -1,10 +1,16 @@
 import concurrent.futures
+import contextlib
+import httpx
+import lxml.etree
+import lxml.html
+import multiprocessing
 import re
-import requests
+import shelve
+import threading
 import time
-from bs4 import BeautifulSoup
+import urllib.parse
 from datetime import datetime, timedelta
-from functools import partial
+from functools import lru_cache
 from itertools import chain
 from timeit import default_timer as timer
 
@@ -37,6 +43,13 @@ UPDATE_INTERVAL_MINS = 10
 # Creates new file each time in same directory script is run from.
 RESULTS_FILENAME = "jobs.txt"
 
+# Where to cache the industry names scraped from the job details pages, so re-scrapes don't scrape them again.
+# Kept in same directory script is run from, across runs of the script.
+INDUSTRY_CACHE_FILENAME = "industries.cache"
+
+# How long to keep using a cached industry name before scraping it again.
+INDUSTRY_CACHE_HOURS = 24
+
 # How many results per page, within range [1, 200]
 RESULTS_PER_PAGE = 200
 
@@ -46,86 +59,299 @@ MAX_THREADS = 50
 # The first part of the URL that is static, from which additional dynamic parameters will be appended as need.
 BASE_URL = "https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit"
 
+# How long to wait for the website to respond, in seconds.
+REQUEST_TIMEOUT_SECS = 10
+
+# How many times to retry a request that failed to connect, send or receive, waiting longer before each retry.
+REQUEST_RETRIES = 3
+
 
 # ============================================================================== #
 
-# Scrape all jobs from all pages using multiple threads since GIL gets released for I/O.
+# Every request goes to the same host, so share one client across all threads to reuse connections,
+# skipping the TCP & TLS handshake for every page. With HTTP/2, all threads multiplex over one or two connections.
+# Still allow one connection per thread, in case the website only speaks HTTP/1.1.
+# Compressed html (including brotli when it's installed) is requested by default, to cut down the bytes on the wire.
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True,
+                                  limits=httpx.Limits(max_connections=MAX_THREADS,
+                                                      max_keepalive_connections=MAX_THREADS)),
+    headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                           "Chrome/106.0.0.0 Safari/537.36"},
+    timeout=REQUEST_TIMEOUT_SECS,
+    follow_redirects=True)
+
+# Compile the patterns once up front, since they get used for every job result on every page.
+_SPACES_RE = re.compile(r" +")
+
+# Keep 1 html parser per thread, since lxml makes threads sharing a parser wait for each other's parsing.
+_THREAD_DATA = threading.local()
+
+# Compile the selectors once up front too, so lxml can run each query in C without re-parsing the expression.
+_JOB_XPATH = lxml.etree.XPath(".//li[contains(@class, 'job-bx')]")
+# Skip text from unwanted nested tags in the company name, e.g., "(More Jobs)" link.
+_COMP_XPATH = lxml.etree.XPath(
+    ".//h3[contains(@class, 'joblist-comp-name')]//text()[not(ancestor::span[contains(@class, 'comp-more')])]")
+_SKILLS_XPATH = lxml.etree.XPath("string(.//span[contains(@class, 'srp-skills')])")
+# Skip text from unwanted nested tags in the published date, e.g., "Work from Home".
+_POSTED_XPATH = lxml.etree.XPath(
+    ".//span[contains(@class, 'sim-posted')]//text()[not(ancestor::span[contains(@class, 'jobs-status')])]")
+_LINK_XPATH = lxml.etree.XPath("./header/h2/a/@href")
+# The industry name is in the element right after its label.
+_INDUSTRY_XPATH = lxml.etree.XPath("string(//label[normalize-space(text())='Industry:']/following-sibling::*[1])")
+_INDUSTRIES_XPATH = lxml.etree.XPath(
+    "//input[contains(@id, 'ind_') and @type='radio' and @name='industryMap']")
+# Misspelling of 'totol' is intentional here. Let's hope they never fix it...
+_TOTAL_RESULTS_XPATH = lxml.etree.XPath("string(//span[@id='totolResultCountsId'])")
+
+
+# Scrape all jobs from all pages using multiple threads since GIL gets released for I/O,
+# and parse them using multiple processes since the GIL doesn't get released for parsing.
+# Returns the jobs sorted by days old, with most recent first, as 1 list of jobs per day old.
 def scrape_jobs(total_pages, total_threads, user_prefs):
-    # Run 1 worker thread per page - up to MAX_THREADS - for an exponential speedup.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=total_threads) as executor:
-        # Collect results from all threads into one list.
-        worker = partial(scrape_jobs_from_page, user_prefs=user_prefs)
-        return list(chain.from_iterable(executor.map(worker, range(1, total_pages + 1))))
-
+    industry_name = user_prefs["industry"]["name"]
 
-# Scrape all jobs from a single page.
-def scrape_jobs_from_page(page_number, user_prefs):
+    # Since there's only a small number of possible days old, sort jobs into them as they come in,
+    # instead of collecting all of them first & sorting them afterwards.
+    jobs = [[] for _ in range(user_prefs["max_days_old"] + 1)]
+
+    # Jobs waiting for the job details page of their company to be scraped, by company name.
+    waiting_jobs = {}
+
+    # Companies whose job details page couldn't be scraped during this scrape, so it doesn't get retried for every job.
+    failed_company_names = set()
+
+    # The parser processes only get started once the download threads are busy with requests, so don't fork them
+    # from this multithreaded process, which can deadlock them. Start them from a clean, single-threaded server instead.
+    # The industry cache is only needed when the job details pages get scraped, i.e., when searching all industries.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=total_threads) as executor, \
+            concurrent.futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver")) as parser, \
+            (contextlib.nullcontext({}) if industry_name else
+             shelve.open(user_prefs["industry_cache_filename"])) as industry_cache:
+        # Industry names scraped from the job details pages, by company name, e.g., during a previous re-scrape.
+        industry_names = get_cached_industry_names(industry_cache, user_prefs["industry_cache_hours"])
+
+        try:
+            # Run 1 worker thread per page - up to MAX_THREADS - for an exponential speedup.
+            # Page downloads, with the page number each one is for.
+            downloads = {executor.submit(download_html, get_url(user_prefs, page_number), CLIENT): page_number
+                         for page_number in range(1, total_pages + 1)}
+
+            # Job details page scrapes, with the company name each one is for.
+            details = {}
+
+            # Handle each download, parse & job details page as soon as it's done, in any order, starting the next
+            # step right away. This keeps the threads busy with job details pages while pages are still being parsed,
+            # and each page's html & jobs are let go of as soon as they've been handled.
+            pending = set(downloads)
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in downloads:
+                        page_number = downloads.pop(future)
+
+                        # Don't let one failed page stop the whole scrape, skip its jobs this time around instead.
+                        try:
+                            html = future.result()
+                        except httpx.HTTPError as error:
+                            print(f"Warning: Skipping page {page_number}, "
+                                  f"couldn't download it ({describe_error(error)}).")
+                            continue
+
+                        # Parse each page in 1 worker process - up to 1 per CPU - as soon as it's downloaded.
+                        pending.add(parser.submit(parse_jobs_from_page, html, user_prefs))
+
+                    elif future in details:
+                        company_name = details.pop(future)
+
+                        # Don't let one failed job details page stop the whole scrape. List the company's jobs
+                        # without an industry this time around, & try again on the next re-scrape.
+                        try:
+                            company_industry_name = future.result()
+                        except httpx.HTTPError as error:
+                            print(f"Warning: Couldn't scrape the industry of {company_name} ({describe_error(error)}).")
+                            failed_company_names.add(company_name)
+                            company_industry_name = ""
+
+                        # Only cache industry names that were actually found, so missing ones get scraped again.
+                        if company_industry_name:
+                            industry_names[company_name] = company_industry_name
+                            industry_cache[company_name] = (company_industry_name, time.time())
+
+                        for job in waiting_jobs.pop(company_name):
+                            jobs[job["days_old"]].append(format_job(job, company_industry_name))
+
+                    # Otherwise it's a parsed page.
+                    else:
+                        for job in future.result():
+                            company_name = job["company_name"]
+
+                            # When the search is already narrowed down to an industry, every job is in it, so skip the
+                            # job details pages. Also skip companies already scraped, e.g., during a previous re-scrape.
+                            if industry_name or company_name in industry_names:
+                                jobs[job["days_old"]].append(
+                                    format_job(job, industry_name or industry_names[company_name]))
+                                continue
+
+                            # Don't retry a failed job details page until the next re-scrape.
+                            if company_name in failed_company_names:
+                                jobs[job["days_old"]].append(format_job(job, ""))
+                                continue
+
+                            # Many jobs are from the same company, so only scrape the job details page of one job per
+                            # company, using the same threads as the pages.
+                            if company_name not in waiting_jobs:
+                                detail = executor.submit(scrape_industry_name, job["link"], CLIENT)
+                                details[detail] = company_name
+                                pending.add(detail)
+
+                            waiting_jobs.setdefault(company_name, []).append(job)
+        except KeyboardInterrupt:
+            # Quit right away, instead of waiting for all the remaining pages & job details pages first.
+            executor.shutdown(wait=False, cancel_futures=True)
+            parser.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return jobs
+
+
+# Parse all matching jobs from a single downloaded page, without their job details.
+def parse_jobs_from_page(html, user_prefs):
     max_days_old = user_prefs["max_days_old"]
     skills = user_prefs["skills"]
-    soup = scrape_html(get_url(user_prefs, page_number))
-    job_results = soup.find_all("li", class_="clearfix job-bx wht-shd-bx")
+    tree = lxml.html.fromstring(html, parser=get_html_parser())
     jobs_in_page = []
 
-    for job_result in job_results:
+    # Neither of these change while scraping, so don't recompute them for every job.
+    today = datetime.today()
+    # Surround each skill with commas so it can only match a whole skill in the comma separated list of skills.
+    required_skills = tuple(f",{skill}," for skill in skills.replace(" ", "").split(",") if skill)
 
-        company_name = job_result.find("h3", class_="joblist-comp-name")
+    for job_result in _JOB_XPATH(tree):
 
-        # Remove unwanted nested tags from company name, e.g., "(More Jobs)" link
-        for more_jobs in company_name.find_all("span", class_="comp-more"): more_jobs.decompose()
+        # Check the published date first, since it's the cheapest way to skip a job.
+        published_date_text = "".join(_POSTED_XPATH(job_result)).strip()
+        days_old = get_days_old(published_date_text)
 
-        all_skills = job_result.find("span",
-                                     class_="srp-skills").text.replace(" ", "").replace(chr(34), "").strip().lower()
+        # Skip jobs that have not been posted within our specified time frame.
+        if days_old < 0 or days_old > max_days_old: continue
+
+        all_skills = _SKILLS_XPATH(job_result).replace(" ", "").replace(chr(34), "").strip().lower()
 
         # Skip jobs that don't have our specific skills.
-        if skills and not set(skills.replace(" ", "").split(",")).issubset(all_skills.split(",")): continue
+        # Scan the skills text directly, rather than splitting it into a set for every job.
+        skills_text = f",{all_skills},"
+        if required_skills and not all(skill in skills_text for skill in required_skills): continue
 
-        published_date = job_result.find("span", class_="sim-posted")
+        company_name = "".join(_COMP_XPATH(job_result)).strip()
 
-        # Remove unwanted nested tags from published date, e.g., "Work from Home"
-        for job_status in published_date.find_all("span", class_=re.compile("jobs-status")): job_status.decompose()
+        jobs_in_page.append({"company_name": company_name,
+                             "skills": all_skills,
+                             "days_old": days_old,
+                             "date": today - timedelta(days=days_old),
+                             "published_date_text": published_date_text,
+                             # Get the URL of the job details page.
+                             "link": _LINK_XPATH(job_result)[0]})
 
-        today = datetime.today()
-        published_date_text = published_date.text.strip()
-        days_old = -1
+    return jobs_in_page
 
-        # Convert the published date description to an exact number of days.
-        if "today" in published_date_text:
-            days_old = 0
-        elif "few days" in published_date_text:
-            days_old = 4  # Some jobs are listed as '3 days ago', use 4 for 'few days ago' to sort them below those.
-        elif "a month" in published_date_text:
-            days_old = 30  # Some jobs are listed as 'a month', instead of '1 month', so handle it separately.
-        elif len(matches := re.findall(r"(\b\d+\b)\Wday", published_date_text)) > 0:
-            days_old = int(matches[0])  # Find jobs listed as 'x days ago', where x is any number of days.
-        elif len(matches := re.findall(r"(\b\d+\b)\Wmonth", published_date_text)) > 0:
-            days_old = int(matches[0]) * 30  # Find jobs listed as 'x months ago', where x is any number of months.
 
-        # Skip jobs that have not been posted within our specified time frame.
-        if days_old < 0 or days_old > max_days_old: continue
+# Get the cached industry names that were scraped recently enough to still be used, by company name.
+# Deletes the rest from the cache, so it doesn't keep growing with every company ever scraped.
+def get_cached_industry_names(industry_cache, industry_cache_hours):
+    oldest_time_secs = time.time() - industry_cache_hours * 60 * 60
+    industry_names = {}
 
-        date = today - timedelta(days=days_old)
+    for company_name in list(industry_cache.keys()):
+        industry_name, scraped_time_secs = industry_cache[company_name]
+        if scraped_time_secs >= oldest_time_secs:
+            industry_names[company_name] = industry_name
+        else:
+            del industry_cache[company_name]
 
-        # Get the URL of the job details page.
-        job_link = job_result.header.h2.a["href"]
+    return industry_names
 
-        # Scrape the industry name from the job details page.
-        industry_name = re.sub(" +", " ",
-                               scrape_html(job_link).find("label", text="Industry:").next_sibling.next_sibling.text)
 
-        text = f"Company: {company_name.text.title().strip()}\n" \
-               f"Industry: {industry_name}\n" \
-               f"Skills: {all_skills}\n" \
-               f"Posted: {date.date()} ({published_date_text.replace('Posted ', '')})\n" \
-               f"Link: {job_link}\n"
+# Convert the published date description to an exact number of days, or -1 if it's not recognized.
+def get_days_old(published_date_text):
+    if "today" in published_date_text:
+        return 0
+    if "few days" in published_date_text:
+        return 4  # Some jobs are listed as '3 days ago', use 4 for 'few days ago' to sort them below those.
+    if "a month" in published_date_text:
+        return 30  # Some jobs are listed as 'a month', instead of '1 month', so handle it separately.
 
-        jobs_in_page.append((days_old, text))
+    # Find jobs listed as 'x days ago' or 'x months ago', where x is any number of days or months.
+    # A plain scan of the words is enough for such a short description, no need for regex.
+    # Split on hyphens too, to also find e.g. '3-day'.
+    words = published_date_text.replace("-", " ").split()
+    for i, word in enumerate(words[:-1]):
+        # Only decimal digits, since int() rejects other digits like '²'.
+        if not word.isdecimal(): continue
+        if words[i + 1].startswith("day"): return int(word)
+        if words[i + 1].startswith("month"): return int(word) * 30
 
-    return jobs_in_page
+    return -1
+
+
+# Scrape the industry name from the job details page.
+def scrape_industry_name(job_link, client=CLIENT):
+    return _SPACES_RE.sub(" ", _INDUSTRY_XPATH(scrape_html(job_link, client)))
+
+
+# Many jobs are from the same company, so cache the formatted company names.
+@lru_cache(maxsize=1024)
+def format_company_name(company_name):
+    return company_name.strip().title()
+
+
+def format_job(job, industry_name):
+    return f"Company: {format_company_name(job['company_name'])}\n" \
+           f"Industry: {industry_name}\n" \
+           f"Skills: {job['skills']}\n" \
+           f"Posted: {job['date'].date()} ({job['published_date_text'].replace('Posted ', '')})\n" \
+           f"Link: {job['link']}\n"
+
+
+# Get this thread's html parser.
+# Builds smaller trees by leaving out the nodes that none of the selectors need:
+# comments, processing instructions, whitespace-only text & the id lookup table.
+def get_html_parser():
+    if not hasattr(_THREAD_DATA, "html_parser"):
+        _THREAD_DATA.html_parser = lxml.html.HTMLParser(remove_blank_text=True, remove_comments=True,
+                                                        remove_pis=True, collect_ids=False)
+    return _THREAD_DATA.html_parser
 
 
-# Download the raw html into Beautiful Soup for parsing with lxml library.
-def scrape_html(url):
-    return BeautifulSoup(requests.get(url).text, "lxml")
+# Download the raw html, as bytes so lxml decodes them itself from the <meta charset>,
+# skipping an intermediate Python string.
+def download_html(url, client=CLIENT):
+    for retry in range(REQUEST_RETRIES + 1):
+        # Back off exponentially before each retry: 0.3, 0.6, 1.2... seconds.
+        if retry: time.sleep(0.3 * 2 ** (retry - 1))
+
+        try:
+            response = client.get(url)
+        except httpx.TransportError:
+            if retry == REQUEST_RETRIES: raise
+            continue
+
+        # Retry when the website is rate limiting us or having trouble, the same as when the connection fails.
+        if (response.status_code == 429 or response.is_server_error) and retry < REQUEST_RETRIES: continue
+
+        # Don't parse error pages.
+        response.raise_for_status()
+        return response.content
+
+
+# Describe a failed request in a few words, e.g., for a one line warning.
+def describe_error(error):
+    return f"HTTP {error.response.status_code}" if isinstance(error, httpx.HTTPStatusError) else type(error).__name__
+
+
+# Download the raw html straight into an lxml tree for parsing.
+def scrape_html(url, client=CLIENT):
+    return lxml.html.fromstring(download_html(url, client), parser=get_html_parser())
 
 
 # Get the full url with modified content/query parameters, ready for scraping.
@@ -136,20 +362,24 @@ def get_url(user_prefs, page_number=1, results_per_page_override=None):
     industry = user_prefs["industry"]
     base_url = user_prefs["base_url"]
 
-    p1 = get_url_results_per_page_param(results_per_page)
-    p2 = get_url_page_number_param(page_number)
-    p3 = get_url_search_keywords_param(search_keywords)
-    p4 = get_url_industry_param(industry)
+    params = {"luceneResultSize": results_per_page,
+              "sequence": page_number,
+              "txtKeywords": search_keywords}
+
+    # Leave out the industry when searching all industries, so the url is the same as before choosing one.
+    if industry and industry["id"]:
+        params.update({"clusterName": "CLUSTER_IND",
+                       "undokey": "cboIndustry",
+                       "cboIndustry": industry["id"],
+                       "gadLink": industry["name"]})
 
-    return f"{base_url}{p1}{p2}{p3}{p4}"
+    # Properly encode the values, e.g., spaces & forward slashes in industry names.
+    return f"{base_url}&{urllib.parse.urlencode(params, quote_via=urllib.parse.quote_plus)}"
 
 
 # Prompt the user to significantly narrow down the search by choosing an industry from a scraped list.
 # When left blank, the job search will include all industries.
 def get_industry_from_user(industries, user_prefs):
-    # Check if industry has already been chosen (i.e., the scraper has run more than once).
-    if industry := user_prefs.get("industry"): return industry
-
     if not (industry_name := user_prefs.get("industry_name")):
         # Ask the user to choose an industry from the scraped list.
         print("Choose an industry number to narrow down your search, or leave blank for all:\n")
@@ -167,9 +397,9 @@ def get_industry_from_user(industries, user_prefs):
     return {"id": industry_id, "name": industry_name if industry_id else ""}
 
 
-def get_industries(soup):
+def get_industries(tree):
     industries = {}
-    for i in soup.find_all('input', id=re.compile("ind_"), attrs={'type': 'radio', 'name': 'industryMap'}):
+    for i in _INDUSTRIES_XPATH(tree):
         url_params = {p[0]: p[1] for p in [v.split("=") for v in i.get("onclick").split("&")] if len(p) == 2}
         industry_name = url_params["gadLink"][:(url_params["gadLink"].find("'"))]
         industry_id = url_params["cboIndustry"]
@@ -177,30 +407,10 @@ def get_industries(soup):
     return industries
 
 
-def get_url_results_per_page_param(results_per_page):
-    return f"&luceneResultSize={results_per_page}"
-
-
-def get_url_page_number_param(page_number):
-    return f"&sequence={page_number}"
-
-
-def get_url_search_keywords_param(search_keywords):
-    return f"&txtKeywords={search_keywords.replace(' ', '+')}"
-
-
-def get_url_industry_param(industry):
-    if not industry: return ""
-    _id = industry['id']
-    name = industry['name'].replace(' ', '+')
-    return f"&clusterName=CLUSTER_IND&undokey=cboIndustry&cboIndustry={_id}&gadLink={name}"
-
-
 def get_total_results(user_prefs):
     total_results_url = get_url(user_prefs, page_number=1, results_per_page_override=1)
-    soup = scrape_html(total_results_url)
-    # Misspelling of 'totol' is intentional here. Let's hope they never fix it...
-    return soup, int(soup.find('span', id="totolResultCountsId").text)
+    tree = scrape_html(total_results_url)
+    return tree, int(_TOTAL_RESULTS_XPATH(tree))
 
 
 def print_jobs(results, user_prefs):
@@ -218,7 +428,8 @@ def print_jobs(results, user_prefs):
     total_search_results = results["total_search_results"]
 
     # Open output_file & write the results.
-    with open(f"{results_filename}", "w") as file:
+    # Use a large write buffer to write the jobs in fewer, bigger chunks.
+    with open(f"{results_filename}", "w", buffering=1024 * 1024) as file:
         # Print the date & time first at the top of the file.
         file.write(f"{datetime.now()}\n\n")
 
@@ -227,7 +438,7 @@ def print_jobs(results, user_prefs):
             f"Searched {total_search_results:,} {search_keywords} jobs across {total_pages:,} pages @ {results_per_page:,} results per page, using {total_threads} threads.\n")
 
         # Print the total_jobs number of jobs found for our search keyword(s).
-        file.write(f"\nFound {len(jobs):,} {search_keywords} jobs,\n")
+        file.write(f"\nFound {sum(len(jobs_by_day) for jobs_by_day in jobs):,} {search_keywords} jobs,\n")
 
         # Print the specified timeframe used to narrow the search.
         file.write(
@@ -243,7 +454,8 @@ def print_jobs(results, user_prefs):
         file.write(f"(Search took {total_time_secs:.0f} seconds.)\n\n")
 
         # Print the jobs, numbered, newest-to-oldest.
-        file.write('\n'.join([f"{i:,}" + '.\n' + str(job[1]) for i, job in enumerate(jobs, start=1)]).strip())
+        # Write them one by one, instead of joining all of them into one huge string first.
+        file.writelines(f"{i:,}.\n{job}\n" for i, job in enumerate(chain.from_iterable(jobs), start=1))
 
     print(f"Done. Wrote results to {results_filename}.")
 
@@ -256,34 +468,40 @@ def main(user_prefs):
     # Time the entire scraping & parsing process, to provide feedback to the user.
     start_time_secs = timer()
 
-    # Get the total results as fast as possible, to figure out how many pages to scrape.
-    soup, total_search_results = get_total_results(user_prefs)
+    total_search_results = None
+
+    # The industry has already been chosen when re-scraping, so there's no need for the list of industries.
+    if not (industry := user_prefs.get("industry")):
+        # Get the total results as fast as possible, to figure out how many pages to scrape.
+        tree, total_search_results = get_total_results(user_prefs)
+
+        # Get the optional industry choice from the user to narrow down the search.
+        industry = get_industry_from_user(get_industries(tree), user_prefs)
 
-    # Get the optional industry choice from the user to narrow down the search.
-    industry = get_industry_from_user(get_industries(soup), user_prefs)
     industry_name = industry["name"]
     user_prefs["industry"] = industry
     user_prefs["industry_name"] = industry_name
 
-    # Get the total results again as fast as possible, this time around we have the industry info to narrow things down.
-    soup, total_search_results = get_total_results(user_prefs)
+    # Get the total results (again) as fast as possible, this time around we have the industry info to narrow things down.
+    # No need to when searching all industries, since the total results from above are already for all of them.
+    if total_search_results is None or industry["id"]:
+        _, total_search_results = get_total_results(user_prefs)
 
     # Results are split into pages, limited by RESULTS_PER_PAGE.
     total_pages = (total_search_results // results_per_page) + (1 if total_search_results % results_per_page > 0 else 0)
 
-    # Limit to MAX_THREADS, since the total pages can easily get out of control.
+    # Limit to MAX_THREADS, since the total pages & job details pages can easily get out of control.
     # One thread per page is only practical up to a certain point.
-    total_threads = min(total_pages, max_threads)
+    # When searching all industries, the job details pages will usually outnumber the pages,
+    # so only limit the threads to the total pages when an industry is chosen & no job details pages get scraped.
+    total_threads = min(total_pages, max_threads) if industry_name else max_threads
 
     print(
         f"\nSearching {total_search_results:,} {search_keywords} jobs in {industry_name or 'all industries'} across {total_pages:,} pages @ {results_per_page:,} results per page, using {total_threads} threads...")
 
-    # Perform the actual multithreaded scraping.
+    # Perform the actual multithreaded scraping, already sorted by days old, with most recent first.
     jobs = scrape_jobs(total_pages, total_threads, user_prefs)
 
-    # Sort by days old, with most recent first.
-    jobs.sort(key=lambda x: x[0])
-
     # Get the total time in seconds that it took to scrape & process the results.
     total_time_secs = timer() - start_time_secs
 
@@ -312,6 +530,8 @@ if __name__ == "__main__":
         "results_filename": RESULTS_FILENAME,
         "results_per_page": RESULTS_PER_PAGE,
         "search_keywords": JOB_SEARCH_KEYWORDS,
+        "industry_cache_hours": INDUSTRY_CACHE_HOURS,
+        "industry_cache_filename": INDUSTRY_CACHE_FILENAME,
         "update_interval_mins": UPDATE_INTERVAL_MINS}
 
     _user_prefs = main(_user_prefs)